@@ -1,47 +1,125 @@
 from fastapi import FastAPI, HTTPException, Query, status, Depends, Request
-from fastapi.responses import RedirectResponse
-from typing import List, Optional
-from datetime import datetime, timedelta
-from pydantic import BaseModel, Field, EmailStr, model_validator
+from fastapi.responses import ORJSONResponse, RedirectResponse, Response
+from typing import AsyncIterator, List, Optional
+from datetime import datetime, timedelta, timezone
+from pydantic import BaseModel, ConfigDict, Field, EmailStr, TypeAdapter, field_validator, model_validator
 from dotenv import load_dotenv
+from logging.handlers import QueueHandler, QueueListener
+import atexit
+import hashlib
+import logging
 import os
-from jose import jwt
-from jose.exceptions import JWTError
-from sqlmodel import Field, Session, SQLModel, create_engine, select, Relationship
-from sqlalchemy import text
+import queue
+import re
+import time
+import unicodedata
+import jwt
+from jwt import InvalidAudienceError, InvalidTokenError
+from sqlmodel import Field, SQLModel, select, Relationship
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, bindparam, func, tuple_, and_, or_, exists, literal, literal_column, delete, not_, text, union_all
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert as pg_insert, plainto_tsquery
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import defer, raiseload
 from sqlalchemy.pool import NullPool
 from fastapi.security import OAuth2PasswordBearer
 import httpx
+import redis.asyncio as redis
+from cachetools import TLRUCache, TTLCache
 
 # --- 1. App & DB Setup ---
 load_dotenv()
+# LOG_LEVEL=DEBUG turns on the per-request auth/event traces; they're skipped (unformatted) at INFO
+# Request code only enqueues records; a background thread does the stderr writes
+log_queue = queue.SimpleQueue()
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO"),
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    handlers=[QueueHandler(log_queue)],
+)
+log_listener = QueueListener(log_queue, logging.StreamHandler())
+log_listener.start()
+atexit.register(log_listener.stop)  # flush whatever is still queued on exit
+log = logging.getLogger("slugsync")
 DATABASE_URL = os.getenv("DATABASE_URL")
 GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID")  # iOS OAuth Client ID
-ADMIN_EMAILS = os.getenv("ADMIN_EMAILS", "").split(",")  # Comma-separated admin emails
+# Comma-separated admin emails; normalized once so membership is a case-insensitive set lookup
+ADMIN_EMAILS = frozenset(
+    email.strip().lower() for email in os.getenv("ADMIN_EMAILS", "").split(",") if email.strip()
+)
+REDIS_URL = os.getenv("REDIS_URL")  # Optional: shares the /events/ response cache across workers
+# Connection pool per worker process; keep workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+# below the database's max_connections
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "5"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "5"))  # Seconds to wait for a free connection
+# Seconds to wait for a new database connection (asyncpg's default is 60), so an
+# unreachable database fails the request fast instead of hanging a worker
+DB_CONNECT_TIMEOUT = int(os.getenv("DB_CONNECT_TIMEOUT", "10"))
 
 if not DATABASE_URL:
     raise RuntimeError("DATABASE_URL not found in .env file")
 if not GOOGLE_CLIENT_ID:
     raise RuntimeError("GOOGLE_CLIENT_ID not found in .env file")
 
-app = FastAPI(title="SlugSync API")
+app = FastAPI(title="SlugSync API", default_response_class=ORJSONResponse)
 # Use transaction pooler URI for production (better for concurrent requests)
 # If using a pooler URI, use NullPool to avoid double pooling
-# If using direct connection URI, SQLAlchemy's default pool is fine
+# If using direct connection URI, SQLAlchemy's pool is fine
 # For Render: use the "Transaction Pooler" URI, not the "Direct Connection" URI
-engine = create_engine(
-    DATABASE_URL,
-    echo=False,
-    # If your DATABASE_URL is a pooler URI (contains "pgbouncer" or similar),
-    # uncomment the next line to use NullPool:
-    # poolclass=NullPool,
-    # Otherwise, SQLAlchemy's default connection pooling will work fine
-    pool_pre_ping=True,  # Verify connections before using them
-    pool_recycle=300,    # Recycle connections after 5 minutes
-)
+# The async engine talks to Postgres through asyncpg, whatever scheme the URL was given with
+ASYNC_DATABASE_URL = re.sub(r"^postgres(ql)?(\+\w+)?://", "postgresql+asyncpg://", DATABASE_URL)
+
+def uses_external_pooler(url: str) -> bool:
+    """True if DATABASE_URL points at PgBouncer/a transaction pooler (or USE_PGBOUNCER=1)"""
+    if os.getenv("USE_PGBOUNCER") == "1":
+        return True
+    return bool(re.search(r"pgbouncer|pooler|:6432\b", url, re.IGNORECASE))
+
+# JIT compilation only adds planning time to the small, indexed queries this API runs.
+# Sent as a startup parameter on direct connections; PgBouncer rejects unknown startup
+# parameters, so behind a pooler the role default set by migration 0004 applies instead
+DB_SERVER_SETTINGS = {"jit": "off"}
+
+def build_engine():
+    if uses_external_pooler(DATABASE_URL):
+        # The pooler already pools server connections; a second pool here would
+        # just pin them, and pre-ping would open transactions it can't release
+        log.info("DB engine: external pooler detected, using NullPool")
+        return create_async_engine(
+            ASYNC_DATABASE_URL,
+            echo=False,
+            poolclass=NullPool,
+            connect_args={
+                # In transaction mode consecutive statements can land on different server
+                # connections, so asyncpg's named prepared statements must be disabled
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "timeout": DB_CONNECT_TIMEOUT,
+            },
+        )
+    log.info("DB engine: LIFO pool, pool_size=%d, max_overflow=%d", DB_POOL_SIZE, DB_MAX_OVERFLOW)
+    return create_async_engine(
+        ASYNC_DATABASE_URL,
+        echo=False,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        # LIFO keeps reusing the same few warm connections and lets the rest idle out
+        pool_use_lifo=True,
+        pool_pre_ping=True,  # Verify connections before using them
+        pool_recycle=60,     # Recycle connections after a minute
+        connect_args={"server_settings": DB_SERVER_SETTINGS, "timeout": DB_CONNECT_TIMEOUT},
+    )
+
+engine = build_engine()
+# expire_on_commit=False: attributes stay readable after commit without an (async) reload
+async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 # --- 2. Security Setup ---
 SECRET_KEY = os.getenv("SECRET_KEY", "lkasdjkjfadskljflpraneethkajf8923983")
+SECRET_KEY_BYTES = SECRET_KEY.encode()  # HS256 key, encoded once rather than per encode/decode
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 1 week
 
@@ -52,9 +130,6 @@ class Token(BaseModel):
     access_token: str
     token_type: str
 
-class TokenData(BaseModel):
-    email: Optional[str] = None
-
 class GoogleAuthRequest(BaseModel):
     id_token: str
 
@@ -68,8 +143,24 @@ class UserCreate(BaseModel):
     name: str
     is_host: bool = True
 
+UTC = timezone.utc
+
+def utc_now() -> datetime:
+    return datetime.now(UTC)
+
+def to_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Timestamps are stored as TIMESTAMPTZ; naive input is taken to already be UTC"""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
 # Database table
 class User(SQLModel, table=True):
+    # Partial index for the admin "who isn't a host yet" list; most users are hosts
+    __table_args__ = (Index("ix_user_not_host", "id", postgresql_where=text("NOT is_host")),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     email: str = Field(unique=True, index=True)
     name: str
@@ -77,29 +168,76 @@ class User(SQLModel, table=True):
     # google_id is optional - will be added via migration if needed
     # google_id: Optional[str] = Field(default=None, unique=True, index=True)
     is_host: bool = Field(default=False)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    events: List["EventModel"] = Relationship(back_populates="owner")
+    # DEFAULT now() in Postgres; users are only inserted by GOOGLE_USER_UPSERT,
+    # so this is read back when the row is next loaded, not on insert
+    created_at: Optional[datetime] = Field(
+        default=None, sa_type=DateTime(timezone=True), sa_column_kwargs={"server_default": func.now()}, nullable=False
+    )
+    # passive_deletes: Postgres nulls out eventmodel.owner_id itself (ON DELETE SET NULL).
+    # lazy="raise": no endpoint needs a user's events implicitly - load them with
+    # selectinload(User.events) where wanted instead of a hidden per-user query
+    events: List["EventModel"] = Relationship(
+        back_populates="owner", sa_relationship_kwargs={"passive_deletes": True, "lazy": "raise"}
+    )
+
+# Google sign-in in one round trip: insert a new user as a host or promote an
+# existing non-host; when neither happens the CTE returns nothing and the
+# second branch reads the existing row. "changed" says whether we wrote.
+_google_upsert = (
+    pg_insert(User)
+    .values(email=bindparam("email"), name=bindparam("name"), is_host=True)
+    .on_conflict_do_update(index_elements=[User.email], set_={"is_host": True}, where=User.is_host.is_(False))
+    .returning(User.id, User.email)
+    .cte("upserted")
+)
+GOOGLE_USER_UPSERT = union_all(
+    select(_google_upsert.c.id, _google_upsert.c.email, literal(True).label("changed")),
+    select(User.id, User.email, literal(False)).where(
+        User.email == bindparam("email"), ~exists(select(_google_upsert.c.id))
+    ),
+)
 
 # API Output
 class UserRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     email: str
     name: str
     is_host: bool
     created_at: datetime
 
+def user_read_from_model(user: User) -> UserRead:
+    """Build a UserRead from a DB row without re-running validation (the row is trusted)"""
+    return UserRead.model_construct(**{name: getattr(user, name) for name in UserRead.model_fields})
+
+# Validates/serializes the admin user list in one pydantic-core call
+USER_LIST_ADAPTER = TypeAdapter(List[UserRead])
+
 # --- 5. Event Models ---
 class EventModel(SQLModel, table=True):
+    # Mirrors the indexes created by migration 0001 so autogenerate sees them;
+    # (owner_id, starts_at) serves per-owner lookups in start order
+    __table_args__ = (Index("ix_eventmodel_owner_id_starts_at", "owner_id", "starts_at"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str
-    starts_at: datetime
+    # list_events orders by starts_at with a LIMIT, so an index scan can stop early
+    starts_at: datetime = Field(sa_type=DateTime(timezone=True), index=True)
     location: str
-    ends_at: Optional[datetime]
+    ends_at: Optional[datetime] = Field(default=None, sa_type=DateTime(timezone=True))
     description: Optional[str]
     host: Optional[str]
     tags: Optional[str]
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    owner_id: Optional[int] = Field(default=None, foreign_key="user.id")
+    # NFKC + casefolded name/location/description, written by build_search_text()
+    search_text: Optional[str] = Field(default=None)
+    # DEFAULT now() in Postgres; create_event's ORM INSERT reads it back via RETURNING
+    created_at: Optional[datetime] = Field(
+        default=None, sa_type=DateTime(timezone=True), sa_column_kwargs={"server_default": func.now()}, nullable=False
+    )
+    owner_id: Optional[int] = Field(
+        default=None, sa_column=Column(Integer, ForeignKey("user.id", ondelete="SET NULL"))
+    )
     owner: Optional[User] = Relationship(back_populates="events")
 
 class EventIn(BaseModel):
@@ -111,6 +249,11 @@ class EventIn(BaseModel):
     host: Optional[str] = None
     tags: Optional[str] = None
 
+    @field_validator("starts_at", "ends_at")
+    @classmethod
+    def normalize_times(cls, value):
+        return to_utc(value)
+
     @model_validator(mode="after")
     def check_times(self):
         if self.ends_at and self.ends_at <= self.starts_at:
@@ -118,6 +261,8 @@ class EventIn(BaseModel):
         return self
 
 class EventOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     name: str
     starts_at: datetime
@@ -129,6 +274,36 @@ class EventOut(BaseModel):
     created_at: datetime
     owner_id: Optional[int]
 
+def event_out_from_model(event: EventModel) -> EventOut:
+    """Build an EventOut from a DB row without re-running validation (the row is trusted)"""
+    return EventOut.model_construct(**{name: getattr(event, name) for name in EventOut.model_fields})
+
+# Validates/serializes a whole event list in one pydantic-core call
+EVENT_LIST_ADAPTER = TypeAdapter(List[EventOut])
+
+# Keyset pagination for /events/: the cursor is the (starts_at, id) of the last
+# event on a page, as "<starts_at in epoch microseconds>_<id>" so it is URL-safe
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+def encode_event_cursor(event: EventModel) -> str:
+    return f"{(event.starts_at - EPOCH) // timedelta(microseconds=1)}_{event.id}"
+
+INT4_MIN, INT4_MAX = -2**31, 2**31 - 1  # eventmodel.id is a Postgres integer
+
+def decode_event_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        micros, event_id = cursor.split("_")
+        starts_at, event_id = EPOCH + timedelta(microseconds=int(micros)), int(event_id)
+    except (ValueError, OverflowError):  # malformed, or a timestamp outside datetime's range
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail="Invalid cursor")
+    if not INT4_MIN <= event_id <= INT4_MAX:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail="Invalid cursor")
+    return starts_at, event_id
+
+def events_page_response(body: bytes, next_cursor: str) -> Response:
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return Response(content=body, media_type="application/json", headers=headers)
+
 class EventUpdate(SQLModel):
     name: Optional[str] = Field(default=None, min_length=1, max_length=120)
     location: Optional[str] = Field(default=None, min_length=1, max_length=160)
@@ -138,44 +313,231 @@ class EventUpdate(SQLModel):
     host: Optional[str] = Field(default=None, max_length=300)
     tags: Optional[str] = Field(default=None)
 
+    @field_validator("starts_at", "ends_at")
+    @classmethod
+    def normalize_times(cls, value):
+        return to_utc(value)
+
 # --- 5b. Favorite Model ---
 class Favorite(SQLModel, table=True):
     """Join table mapping a user to favorited events."""
-    user_id: int = Field(foreign_key="user.id", primary_key=True)
-    event_id: int = Field(foreign_key="eventmodel.id", primary_key=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    user_id: int = Field(
+        sa_column=Column(Integer, ForeignKey("user.id", ondelete="CASCADE"), primary_key=True)
+    )
+    # Indexed on its own: the (user_id, event_id) PK can't serve event-side lookups or cascades
+    event_id: int = Field(
+        sa_column=Column(Integer, ForeignKey("eventmodel.id", ondelete="CASCADE"), primary_key=True, index=True)
+    )
+    # DEFAULT now() in Postgres; favorite_event's Core insert never reads it back
+    created_at: Optional[datetime] = Field(
+        default=None, sa_type=DateTime(timezone=True), sa_column_kwargs={"server_default": func.now()}, nullable=False
+    )
+
+# --- 5c. Tag Models ---
+class Tag(SQLModel, table=True):
+    """A distinct, lower-cased tag name."""
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str = Field(unique=True, index=True)
+
+class EventTag(SQLModel, table=True):
+    """Join table mapping an event to its tags (derived from EventModel.tags)."""
+    event_id: int = Field(
+        sa_column=Column(Integer, ForeignKey("eventmodel.id", ondelete="CASCADE"), primary_key=True)
+    )
+    tag_id: int = Field(foreign_key="tag.id", primary_key=True, index=True)
 
 # --- 6. Database Setup ---
-def create_db_and_tables():
-    SQLModel.metadata.create_all(engine)
+# Full-text search document for an event. ix_eventmodel_search is built on
+# this exact expression (migrations/versions/0001_baseline_schema.py), so
+# list_events must query it verbatim to use the index.
+EVENT_SEARCH_DOCUMENT = (
+    "to_tsvector('english', eventmodel.name || ' ' || eventmodel.location"
+    " || ' ' || coalesce(eventmodel.description, ''))"
+)
+
+# Schema (tables, indexes, extensions) is managed by Alembic - see migrations/.
+
+# Shared outbound HTTP client so Google calls reuse pooled keep-alive connections
+http_client: Optional[httpx.AsyncClient] = None
+
+# Google ID tokens are verified locally against Google's published signing keys
+GOOGLE_CERTS_URL = "https://www.googleapis.com/oauth2/v3/certs"
+GOOGLE_ISSUERS = ["accounts.google.com", "https://accounts.google.com"]
+google_signing_keys: dict = {}  # kid -> PyJWK
+google_signing_keys_fetched_at = 0.0
+google_signing_keys_expire_at = 0.0
+# An unknown kid forces an early refetch (Google rotated keys), but at most this often
+GOOGLE_CERTS_MIN_REFETCH_SECONDS = 60
+
+# sha256(id_token) -> verified claims, kept until min(5 min, token exp)
+GOOGLE_ID_TOKEN_CACHE_TTL_SECONDS = 300
+google_id_token_cache = TLRUCache(
+    maxsize=2_000,
+    ttu=lambda _key, user_info, now: min(now + GOOGLE_ID_TOKEN_CACHE_TTL_SECONDS, int(user_info.get("exp", 0))),
+    timer=time.time,
+)
 
 @app.on_event("startup")
-def on_startup():
-    create_db_and_tables()
+async def on_startup():
+    global http_client
+    http_client = httpx.AsyncClient(
+        timeout=5.0,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+    )
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    await http_client.aclose()
 
-def get_session():
-    with Session(engine) as session:
+async def get_session() -> AsyncIterator[AsyncSession]:
+    async with async_session() as session:
         yield session
 
+# --- 6b. Search & Tag Helpers ---
+def normalize_search_text(value: str) -> str:
+    """Fold text for matching: NFKC so composed/decomposed forms compare equal, then casefold"""
+    if value.isascii():
+        return value.lower()  # NFKC is a no-op on ASCII
+    return unicodedata.normalize("NFKC", value).casefold()
+
+def build_search_text(event: EventModel) -> str:
+    """Normalized haystack for q-search; fields are joined with a separator q can't span"""
+    return normalize_search_text(f"{event.name}\x1f{event.location}\x1f{event.description or ''}")
+
+def parse_tags(tags: Optional[str]) -> List[str]:
+    """Split a comma-separated tag string into unique, lower-cased tag names"""
+    return list(dict.fromkeys(t.strip().lower() for t in (tags or "").split(",") if t.strip()))
+
+async def sync_event_tags(session: AsyncSession, event: EventModel):
+    """Rewrite an event's EventTag rows to match its comma-separated tags (caller commits)"""
+    names = parse_tags(event.tags)
+    await session.exec(delete(EventTag).where(EventTag.event_id == event.id))
+    if not names:
+        return
+    await session.exec(
+        pg_insert(Tag).values([{"name": name} for name in names]).on_conflict_do_nothing(index_elements=["name"])
+    )
+    tag_ids = (await session.exec(select(Tag.id).where(Tag.name.in_(names)))).all()
+    session.add_all([EventTag(event_id=event.id, tag_id=tag_id) for tag_id in tag_ids])
+
+# --- 6c. Event List Cache ---
+# GET /events/ responses are cached as rendered JSON for a few seconds. With
+# REDIS_URL set the cache is shared by all workers; otherwise each process
+# keeps its own, and other workers may serve a stale list until the TTL expires.
+EVENTS_CACHE_TTL_SECONDS = 20
+EVENTS_CACHE_PREFIX = "slugsync:events:"
+redis_client = redis.from_url(REDIS_URL) if REDIS_URL else None
+local_events_cache = TTLCache(maxsize=1024, ttl=EVENTS_CACHE_TTL_SECONDS)
+
+async def get_cached_events(key: str) -> Optional[bytes]:
+    if redis_client is None:
+        return local_events_cache.get(key)
+    try:
+        return await redis_client.get(EVENTS_CACHE_PREFIX + key)
+    except redis.RedisError as e:
+        log.warning("Events cache read failed: %s", e)
+        return None
+
+async def set_cached_events(key: str, body: bytes):
+    if redis_client is None:
+        local_events_cache[key] = body
+        return
+    try:
+        await redis_client.set(EVENTS_CACHE_PREFIX + key, body, ex=EVENTS_CACHE_TTL_SECONDS)
+    except redis.RedisError as e:
+        log.warning("Events cache write failed: %s", e)
+
+async def invalidate_events_cache():
+    """Drop every cached event list (call after any event write)"""
+    local_events_cache.clear()
+    if redis_client is None:
+        return
+    try:
+        keys = [key async for key in redis_client.scan_iter(match=EVENTS_CACHE_PREFIX + "*")]
+        if keys:
+            await redis_client.unlink(*keys)
+    except redis.RedisError as e:
+        log.warning("Events cache invalidation failed: %s", e)
+
 # --- 7. Auth Utility Functions ---
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = utc_now() + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = utc_now() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, SECRET_KEY_BYTES, algorithm=ALGORITHM)
     return encoded_jwt
 
 def verify_ucsc_email(email: str) -> bool:
     """Verify that the email is from UCSC (@ucsc.edu)"""
-    return email.lower().endswith("@ucsc.edu")
+    # Only the 9-character domain suffix needs case-folding, not the whole address
+    return email[-9:].lower() == "@ucsc.edu"
+
+async def get_google_signing_keys(force_refresh: bool = False) -> dict:
+    """Google's signing keys by kid, refetched once the response's Cache-Control max-age runs out"""
+    global google_signing_keys, google_signing_keys_fetched_at, google_signing_keys_expire_at
+    if not force_refresh and time.time() < google_signing_keys_expire_at:
+        return google_signing_keys
+    response = await http_client.get(GOOGLE_CERTS_URL)
+    response.raise_for_status()
+    google_signing_keys = {key.key_id: key for key in jwt.PyJWKSet.from_dict(response.json()).keys}
+    max_age = re.search(r"max-age=(\d+)", response.headers.get("cache-control", ""))
+    google_signing_keys_fetched_at = time.time()
+    google_signing_keys_expire_at = google_signing_keys_fetched_at + (int(max_age.group(1)) if max_age else 3600)
+    return google_signing_keys
+
+async def verify_google_id_token(id_token: str) -> dict:
+    """Verify a Google ID token's RS256 signature, audience, issuer and expiry; returns its claims"""
+    kid = jwt.get_unverified_header(id_token).get("kid")
+    signing_key = (await get_google_signing_keys()).get(kid)
+    if signing_key is None and time.time() - google_signing_keys_fetched_at > GOOGLE_CERTS_MIN_REFETCH_SECONDS:
+        signing_key = (await get_google_signing_keys(force_refresh=True)).get(kid)
+    if signing_key is None:
+        raise InvalidTokenError(f"Unknown Google signing key: {kid}")
+    return jwt.decode(
+        id_token,
+        signing_key.key,
+        algorithms=["RS256"],
+        audience=GOOGLE_CLIENT_ID,
+        issuer=GOOGLE_ISSUERS,
+    )
 
 # --- 8. Auth Dependency ---
+# Validated token -> (user id, exp). Repeat requests with the same token skip
+# jwt.decode and the email lookup. Entries live at most TOKEN_CACHE_TTL_SECONDS
+# and never past the token's own expiry; failed validations are never cached.
+TOKEN_CACHE_TTL_SECONDS = 60
+# sha256(token) -> (user_id, exp); keyed by digest so raw bearer tokens aren't kept in memory
+token_cache = TLRUCache(
+    maxsize=10_000,
+    ttu=lambda _key, entry, now: min(now + TOKEN_CACHE_TTL_SECONDS, entry[1]),
+    timer=time.time,
+)
+# user_id -> detached User row, so a cached token needs no DB round trip at all
+user_cache = TTLCache(maxsize=5_000, ttl=TOKEN_CACHE_TTL_SECONDS)
+
+def cache_user(session: AsyncSession, user: User) -> None:
+    """Cache a detached copy: a rollback later in this request would otherwise expire
+    the shared instance, and every cache hit after that would raise DetachedInstanceError"""
+    session.expunge(user)
+    user_cache[user.id] = user
+
+def forget_cached_user(user_id: int) -> None:
+    """Drop a user from the auth cache after their row changes"""
+    user_cache.pop(user_id, None)
+
+# Authentication never needs the password hash, so it isn't fetched for the
+# cached current_user; raiseload turns an accidental read into an error, not a query
+AUTH_USER_OPTIONS = [defer(User.hashed_password, raiseload=True)]
+
+# Built once so the compiled SQL is reused; run with session.scalar(..., {"email": ...})
+USER_BY_EMAIL = select(User).options(*AUTH_USER_OPTIONS).where(User.email == bindparam("email"))
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ) -> User:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -184,36 +546,51 @@ async def get_current_user(
     )
 
     if not token:
-        print("❌ No token provided in Authorization header")
+        log.debug("No token provided in Authorization header")
         raise credentials_exception
 
-    print(f"🔑 Received token (first 30 chars): {token[:30] if len(token) > 30 else token}...")
-    print(f"🔑 Token length: {len(token)}")
-    print(f"🔑 Using SECRET_KEY (first 10 chars): {SECRET_KEY[:10]}...")
+    token_key = hashlib.sha256(token.encode()).digest()
+    cached = token_cache.get(token_key)
+    if cached is not None:
+        user = user_cache.get(cached[0])
+        if user is None:
+            user = await session.get(User, cached[0], options=AUTH_USER_OPTIONS)
+            if user is None:
+                raise credentials_exception
+            cache_user(session, user)
+        return user
+
+    log.debug("Decoding token (length %d)", len(token))
 
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
-            print("❌ Token payload missing 'sub' field")
+        payload = jwt.decode(token, SECRET_KEY_BYTES, algorithms=[ALGORITHM])
+        subject: str = payload.get("sub")
+        if subject is None:
+            log.info("Token payload missing 'sub' field")
             raise credentials_exception
-        print(f"✅ Token decoded successfully for email: {email}")
-        token_data = TokenData(email=email)
-    except JWTError as e:
-        print(f"❌ JWT decode error: {str(e)}")
-        print(f"❌ This usually means the token was created with a different SECRET_KEY")
+        log.debug("Token decoded for subject %s", subject)
+    except InvalidTokenError as e:
+        # Usually an expired token, or one signed with a different SECRET_KEY
+        log.info("JWT decode error: %s", e)
         raise credentials_exception
 
-    user = session.exec(select(User).where(User.email == token_data.email)).first()
+    # sub is the user id (a primary-key lookup); tokens issued before that
+    # change carry the email instead and are still honoured until they expire
+    if subject.isdigit():
+        user = await session.get(User, int(subject), options=AUTH_USER_OPTIONS)
+    else:
+        user = await session.scalar(USER_BY_EMAIL, {"email": subject})
     if user is None:
-        print(f"❌ User not found for email: {token_data.email}")
+        log.info("User not found for token subject: %s", subject)
         raise credentials_exception
-    print(f"✅ User authenticated: {user.email}, is_host: {user.is_host}")
+    log.debug("User authenticated: %s, is_host: %s", user.email, user.is_host)
+    token_cache[token_key] = (user.id, payload.get("exp", 0))
+    cache_user(session, user)
     return user
 
 async def get_current_admin(current_user: User = Depends(get_current_user)) -> User:
     """Verify that the current user is an admin"""
-    if current_user.email not in ADMIN_EMAILS:
+    if current_user.email.lower() not in ADMIN_EMAILS:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required"
@@ -222,162 +599,101 @@ async def get_current_admin(current_user: User = Depends(get_current_user)) -> U
 
 # --- 9. Auth Endpoint for iOS ---
 @app.post("/auth/google", response_model=Token, tags=["auth"])
-async def authenticate_with_google(
-    auth_request: GoogleAuthRequest,
-    session: Session = Depends(get_session)
-):
+async def authenticate_with_google(auth_request: GoogleAuthRequest):
     """
     Accept Google ID token from iOS app, verify it, and return JWT token.
     iOS app uses Google Sign-In SDK to get the ID token, then sends it here.
     """
     try:
-        async with httpx.AsyncClient() as client:
-            # Verify Google ID token
-            verify_url = f"https://oauth2.googleapis.com/tokeninfo?id_token={auth_request.id_token}"
-            response = await client.get(verify_url)
-            
-            if response.status_code != 200:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Invalid Google token"
-                )
-            
-            user_info = response.json()
-            
-            # Verify the token is for our app
-            if user_info.get("aud") != GOOGLE_CLIENT_ID:
+        # Sign-in retries resend the same id_token; skip re-verifying it if it was verified recently
+        id_token_key = hashlib.sha256(auth_request.id_token.encode()).digest()
+        user_info = google_id_token_cache.get(id_token_key)
+        if user_info is None:
+            # Verify Google ID token locally (signing keys are cached, so usually no network call)
+            try:
+                user_info = await verify_google_id_token(auth_request.id_token)
+            except InvalidAudienceError:
+                # Verify the token is for our app
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Token was not issued for this application"
                 )
-            
-            email = user_info.get("email")
-            google_id = user_info.get("sub")
-            name = user_info.get("name", email.split("@")[0] if email else "User")
-            
-            if not email:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Email not provided by Google"
-                )
-            
-            # Verify UCSC email
-            if not verify_ucsc_email(email):
+            except InvalidTokenError:
                 raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="Only @ucsc.edu emails are allowed to access SlugSync"
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Invalid Google token"
                 )
-            
-            # Get or create user
+            google_id_token_cache[id_token_key] = user_info
+        
+        email = user_info.get("email")
+        google_id = user_info.get("sub")
+        name = user_info.get("name", email.split("@")[0] if email else "User")
+        
+        if not email:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email not provided by Google"
+            )
+        
+        # Verify UCSC email
+        if not verify_ucsc_email(email):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only @ucsc.edu emails are allowed to access SlugSync"
+            )
+        
+        # Get or create user. The session is only opened now, after the Google round trip,
+        # so no pooled connection sits idle while we wait on the network
+        async with async_session() as session:
             try:
-                user = session.exec(select(User).where(User.email == email)).first()
-                
-                if not user:
-                    # Create new user (without password for Google OAuth users)
-                    user = User(
-                        email=email,
-                        name=name,
-                        hashed_password=None,  # Google users don't have passwords
-                        is_host=True
-                    )
-                    session.add(user)
-                    session.commit()
-                    session.refresh(user)
-                    print(f"✅ Created new user: {user.email} (is_host=True)")
+                # Google users have no password, so hashed_password stays NULL.
+                # The token only needs id and email, which is all this returns
+                user = (await session.exec(
+                    GOOGLE_USER_UPSERT, params={"email": email, "name": name}
+                )).one_or_none()
+                if user is None:
+                    # A concurrent first login inserted this email after our snapshot was
+                    # taken: the upsert waited, then neither branch could see the new row.
+                    # A fresh statement gets a fresh snapshot (READ COMMITTED)
+                    user = await session.scalar(USER_BY_EMAIL, {"email": email})
+                    log.debug("Found user created by a concurrent login: %s", user.email)
+                elif user.changed:
+                    await session.commit()
+                    forget_cached_user(user.id)
+                    log.info("Created or promoted user to host: %s", user.email)
                 else:
-                    if not user.is_host:
-                        user.is_host = True
-                        session.add(user)
-                        session.commit()
-                        session.refresh(user)
-                        print(f"✅ Updated existing user to host: {user.email}")
-                    else:
-                        print(f"✅ Found existing user: {user.email}")
+                    log.debug("Found existing user: %s", user.email)
             except Exception as db_error:
-                session.rollback()
+                await session.rollback()
                 error_msg = str(db_error)
-                print(f"❌ Database error in Google auth: {error_msg}")
-                import traceback
-                traceback.print_exc()
+                log.exception("Database error in Google auth")
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                     detail=f"Database error: {error_msg}. Please check backend logs."
                 )
-            
-            # Create our JWT token
-            access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-            access_token = create_access_token(
-                data={"sub": user.email}, 
-                expires_delta=access_token_expires
-            )
-            
-            return {"access_token": access_token, "token_type": "bearer"}
+        
+        # Create our JWT token
+        access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+        access_token = create_access_token(
+            data={"sub": str(user.id), "email": user.email},
+            expires_delta=access_token_expires
+        )
+        
+        return {"access_token": access_token, "token_type": "bearer"}
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error in Google authentication: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Error in Google authentication")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Internal server error: {str(e)}"
         )
 
-# --- 9.5. Migration Endpoints (TEMPORARY - Remove after running once) ---
-@app.post("/migrate/fix-database", tags=["migration"])
-def migrate_fix_database():
-    """
-    TEMPORARY: Fix database schema for Google OAuth support.
-    - Makes hashed_password nullable
-    - Adds google_id column if it doesn't exist
-    Run this once, then remove this endpoint.
-    Call: POST https://your-backend.onrender.com/migrate/fix-database
-    """
-    try:
-        with engine.connect() as conn:
-            results = []
-            
-            # 1. Make hashed_password nullable
-            try:
-                conn.execute(text('ALTER TABLE "user" ALTER COLUMN hashed_password DROP NOT NULL'))
-                conn.commit()
-                results.append("✅ Made hashed_password nullable")
-            except Exception as e:
-                results.append(f"⚠️ hashed_password: {str(e)}")
-            
-            # 2. Add google_id column if it doesn't exist
-            try:
-                result = conn.execute(text("""
-                    SELECT column_name 
-                    FROM information_schema.columns 
-                    WHERE table_name='user' AND column_name='google_id'
-                """))
-                
-                if not result.fetchone():
-                    conn.execute(text('ALTER TABLE "user" ADD COLUMN google_id VARCHAR(255)'))
-                    conn.execute(text('CREATE INDEX IF NOT EXISTS ix_user_google_id ON "user"(google_id)'))
-                    conn.commit()
-                    results.append("✅ Added google_id column")
-                else:
-                    results.append("✅ google_id column already exists")
-            except Exception as e:
-                results.append(f"⚠️ google_id: {str(e)}")
-            
-            return {"status": "success", "messages": results}
-    except Exception as e:
-        return {"status": "error", "message": str(e)}
-
 # --- 10. User Endpoints ---
 @app.get("/users/me", response_model=UserRead, tags=["users"])
 async def get_current_user_info(current_user: User = Depends(get_current_user)):
     """Get the current logged-in user's information"""
-    return UserRead(
-        id=current_user.id,
-        email=current_user.email,
-        name=current_user.name,
-        is_host=current_user.is_host,
-        created_at=current_user.created_at
-    )
+    return user_read_from_model(current_user)
 
 # REMOVED: Self-service host status endpoint
 # Users can no longer make themselves hosts
@@ -387,30 +703,26 @@ async def get_current_user_info(current_user: User = Depends(get_current_user)):
 @app.get("/admin/users", response_model=List[UserRead], tags=["admin"])
 async def list_all_users(
     admin: User = Depends(get_current_admin),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     is_host: Optional[bool] = Query(None, description="Filter by host status")
 ):
     """List all users (admin only)"""
     statement = select(User)
     if is_host is not None:
-        statement = statement.where(User.is_host == is_host)
-    users = session.exec(statement).all()
-    return [UserRead(
-        id=user.id,
-        email=user.email,
-        name=user.name,
-        is_host=user.is_host,
-        created_at=user.created_at
-    ) for user in users]
+        # Inlined rather than bound so the planner can match ix_user_not_host
+        statement = statement.where(User.is_host if is_host else not_(User.is_host))
+    users = (await session.exec(statement)).all()
+    body = USER_LIST_ADAPTER.dump_json(USER_LIST_ADAPTER.validate_python(users, from_attributes=True))
+    return Response(content=body, media_type="application/json")
 
 @app.patch("/admin/users/{user_id}/approve-host", response_model=UserRead, tags=["admin"])
 async def approve_host_status(
     user_id: int,
     admin: User = Depends(get_current_admin),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
     """Approve a user to become an event host (admin only)"""
-    user = session.get(User, user_id)
+    user = await session.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -422,25 +734,19 @@ async def approve_host_status(
 
     user.is_host = True
     session.add(user)
-    session.commit()
-    session.refresh(user)
-
-    return UserRead(
-        id=user.id,
-        email=user.email,
-        name=user.name,
-        is_host=user.is_host,
-        created_at=user.created_at
-    )
+    await session.commit()
+    forget_cached_user(user.id)
+
+    return user_read_from_model(user)
 
 @app.patch("/admin/users/{user_id}/revoke-host", response_model=UserRead, tags=["admin"])
 async def revoke_host_status(
     user_id: int,
     admin: User = Depends(get_current_admin),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
     """Revoke a user's event host status (admin only)"""
-    user = session.get(User, user_id)
+    user = await session.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -452,109 +758,104 @@ async def revoke_host_status(
 
     user.is_host = False
     session.add(user)
-    session.commit()
-    session.refresh(user)
-
-    return UserRead(
-        id=user.id,
-        email=user.email,
-        name=user.name,
-        is_host=user.is_host,
-        created_at=user.created_at
-    )
+    await session.commit()
+    forget_cached_user(user.id)
+
+    return user_read_from_model(user)
 
 # --- 12. Event Endpoints ---
 @app.get("/events/", response_model=List[EventOut], tags=["events"])
-def list_events(
-    session: Session = Depends(get_session),
+async def list_events(
+    session: AsyncSession = Depends(get_session),
     q: Optional[str] = Query(None, min_length=3),
     tag: Optional[str] = Query(None),
     start_date: Optional[datetime] = Query(None),
     end_date: Optional[datetime] = Query(None),
     limit: int = Query(50, ge=1, le=500),
-    include_past: bool = Query(False, description="Include past events")
+    include_past: bool = Query(False, description="Include past events"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page")
 ):
-    """List all events with optional filtering"""
-    statement = select(EventModel)
+    """List all events with optional filtering.
+
+    A full page sets the X-Next-Cursor header; pass it back as ?cursor= to get the next page.
+    """
+    cache_key = f"{q}|{tag}|{start_date}|{end_date}|{limit}|{include_past}|{cursor}"
+    cached = await get_cached_events(cache_key)
+    if cached is not None:
+        # Cached as b"<next cursor>\n<body>" - orjson never emits a raw newline
+        next_cursor, _, body = cached.partition(b"\n")
+        return events_page_response(body, next_cursor.decode())
+
+    # EventOut doesn't include the owner, so forbid lazy-loading it per row (N+1)
+    statement = select(EventModel).options(raiseload(EventModel.owner), defer(EventModel.search_text))
 
     # Filter out past events by default - use ends_at so events disappear after they finish
     if not include_past:
-        from datetime import timezone
-        now = datetime.now(timezone.utc)
-        # Keep events that haven't ended yet (ends_at is in the future or NULL)
-        # Use COALESCE to fall back to starts_at if ends_at is NULL
-        from sqlalchemy import func
+        now = utc_now()
+        # Keep events that haven't ended yet, falling back to starts_at when ends_at is NULL.
+        # Split into two branches (instead of COALESCE) so each can use its partial index
         statement = statement.where(
-            func.coalesce(EventModel.ends_at, EventModel.starts_at) >= now
+            or_(
+                and_(EventModel.ends_at.is_(None), EventModel.starts_at >= now),
+                EventModel.ends_at >= now,
+            )
         )
 
     # Filter by start date if provided
     if start_date:
-        statement = statement.where(EventModel.starts_at >= start_date)
+        statement = statement.where(EventModel.starts_at >= to_utc(start_date))
 
     # Filter by end date if provided
     if end_date:
-        statement = statement.where(EventModel.starts_at <= end_date)
-
-    results = session.exec(statement).all()
-
-    filtered_results = []
-    for event in results:
-        if q:
-            q_lower = q.lower()
-            if not (q_lower in event.name.lower() or
-                    q_lower in (event.description or "").lower() or
-                    q_lower in event.location.lower()):
-                continue
-        if tag:
-            tag_lower = tag.lower()
-            event_tags = [t.strip().lower() for t in (event.tags or "").split(',') if t.strip()]
-            if tag_lower not in event_tags:
-                continue
-        filtered_results.append(event)
-
-    # Sort by start date - soonest first
-    filtered_results.sort(key=lambda e: e.starts_at)
-
-    return [
-        EventOut(
-            id=ev.id,
-            name=ev.name,
-            starts_at=ev.starts_at,
-            ends_at=ev.ends_at,
-            location=ev.location,
-            description=ev.description,
-            host=ev.host,
-            tags=ev.tags,
-            created_at=ev.created_at,
-            owner_id=ev.owner_id
+        statement = statement.where(EventModel.starts_at <= to_utc(end_date))
+
+    # Full-text match (stemmed words) or substring match on the normalized
+    # search_text; both branches are served by GIN indexes
+    if q:
+        statement = statement.where(or_(
+            literal_column(EVENT_SEARCH_DOCUMENT).op("@@")(plainto_tsquery("english", q)),
+            EventModel.search_text.contains(normalize_search_text(q), autoescape=True),
+        ))
+
+    # Exact tag match through the normalized tag tables
+    if tag:
+        statement = (
+            statement
+            .join(EventTag, EventTag.event_id == EventModel.id)
+            .join(Tag, Tag.id == EventTag.tag_id)
+            .where(Tag.name == tag.strip().lower())
+        )
+
+    # Resume after the last event of the previous page; id breaks starts_at ties
+    if cursor:
+        statement = statement.where(
+            tuple_(EventModel.starts_at, EventModel.id) > tuple_(*decode_event_cursor(cursor))
         )
-        for ev in filtered_results[:limit]
-    ]
+
+    # Sort by start date - soonest first - and let the database apply the limit
+    statement = statement.order_by(EventModel.starts_at, EventModel.id).limit(limit)
+    results = (await session.exec(statement)).all()
+
+    events = EVENT_LIST_ADAPTER.validate_python(results, from_attributes=True)
+    body = EVENT_LIST_ADAPTER.dump_json(events)
+    next_cursor = encode_event_cursor(results[-1]) if len(results) == limit else ""
+    await set_cached_events(cache_key, next_cursor.encode() + b"\n" + body)
+    return events_page_response(body, next_cursor)
 
 @app.get("/events/{event_id}", response_model=EventOut, tags=["events"])
-def get_event(event_id: int, session: Session = Depends(get_session)):
+async def get_event(event_id: int, session: AsyncSession = Depends(get_session)):
     """Get a specific event by ID"""
-    event = session.get(EventModel, event_id)
+    event = await session.get(
+        EventModel, event_id, options=[raiseload(EventModel.owner), defer(EventModel.search_text)]
+    )
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
-    return EventOut(
-        id=event.id,
-        name=event.name,
-        starts_at=event.starts_at,
-        ends_at=event.ends_at,
-        location=event.location,
-        description=event.description,
-        host=event.host,
-        tags=event.tags,
-        created_at=event.created_at,
-        owner_id=event.owner_id
-    )
+    return event_out_from_model(event)
 
 @app.post("/events/", response_model=EventOut, status_code=status.HTTP_201_CREATED, tags=["events"])
-def create_event(
+async def create_event(
     event_data: EventIn,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """Create a new event (requires host status)"""
@@ -565,67 +866,46 @@ def create_event(
                 detail="Only event hosts can create events. Update your profile to become a host."
             )
 
-        print(f"🔵 Creating event for user: {current_user.email}, is_host: {current_user.is_host}")
-        print(f"🔵 Event data: {event_data.model_dump()}")
-
-        # Create EventModel - FastAPI already parsed ISO 8601 strings to datetime
-        db_event = EventModel(
-            name=event_data.name,
-            starts_at=event_data.starts_at,
-            ends_at=event_data.ends_at,
-            location=event_data.location,
-            description=event_data.description,
-            host=event_data.host,
-            tags=event_data.tags,
-            owner_id=current_user.id
-        )
-        print(f"🔵 Created EventModel: {db_event}")
+        log.debug("Creating event for user: %s, data: %s", current_user.email, event_data)
+
+        # Create EventModel - EventIn has already parsed and validated every field
+        db_event = EventModel(**event_data.model_dump(), owner_id=current_user.id)
+        db_event.search_text = build_search_text(db_event)
 
         session.add(db_event)
-        session.commit()
-        session.refresh(db_event)
-
-        print(f"✅ Event created successfully with ID: {db_event.id}")
-        return EventOut(
-            id=db_event.id,
-            name=db_event.name,
-            starts_at=db_event.starts_at,
-            ends_at=db_event.ends_at,
-            location=db_event.location,
-            description=db_event.description,
-            host=db_event.host,
-            tags=db_event.tags,
-            created_at=db_event.created_at,
-            owner_id=db_event.owner_id
-        )
+        # The INSERT's RETURNING fills in db_event.id and the server-default created_at;
+        # every other column was set here, and expire_on_commit=False keeps them loaded,
+        # so no refresh
+        await session.flush()
+        await sync_event_tags(session, db_event)
+        await session.commit()
+        await invalidate_events_cache()
+
+        log.info("Event %d created by %s", db_event.id, current_user.email)
+        return event_out_from_model(db_event)
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Error creating event: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Error creating event")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error creating event: {str(e)}"
         )
 
 @app.patch("/events/{event_id}", response_model=EventOut, tags=["events"])
-def update_event(
+async def update_event(
     event_id: int,
     event_update: EventUpdate,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """Update an existing event (requires ownership)"""
-    print(f"🔄 Update request for event {event_id} by user {current_user.email}")
-    print(f"🔄 Update data received: {event_update.model_dump(exclude_unset=True)}")
+    log.debug("Update request for event %d by user %s", event_id, current_user.email)
 
-    db_event = session.get(EventModel, event_id)
+    db_event = await session.get(EventModel, event_id)
     if not db_event:
         raise HTTPException(status_code=404, detail="Event not found")
 
-    print(f"🔄 Current event in DB - starts_at: {db_event.starts_at}, ends_at: {db_event.ends_at}")
-
     if db_event.owner_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -633,37 +913,39 @@ def update_event(
         )
 
     update_data = event_update.model_dump(exclude_unset=True)
-    print(f"🔄 Fields being updated: {update_data}")
+    log.debug("Fields being updated: %s", update_data)
+
+    # Only re-check the time range when one of its ends actually changes
+    if update_data.keys() & {"starts_at", "ends_at"}:
+        starts_at = update_data.get("starts_at", db_event.starts_at)
+        ends_at = update_data.get("ends_at", db_event.ends_at)
+        if starts_at is None:
+            raise HTTPException(status_code=422, detail="starts_at cannot be null")
+        if ends_at and ends_at <= starts_at:
+            raise HTTPException(status_code=422, detail="ends_at must be after starts_at")
 
     db_event.sqlmodel_update(update_data)
+    if update_data.keys() & {"name", "location", "description"}:
+        db_event.search_text = build_search_text(db_event)
 
     session.add(db_event)
-    session.commit()
-    session.refresh(db_event)
-
-    print(f"✅ Event updated - new starts_at: {db_event.starts_at}, new ends_at: {db_event.ends_at}")
-
-    return EventOut(
-        id=db_event.id,
-        name=db_event.name,
-        starts_at=db_event.starts_at,
-        ends_at=db_event.ends_at,
-        location=db_event.location,
-        description=db_event.description,
-        host=db_event.host,
-        tags=db_event.tags,
-        created_at=db_event.created_at,
-        owner_id=db_event.owner_id
-    )
+    if "tags" in update_data:
+        await sync_event_tags(session, db_event)
+    await session.commit()
+    await invalidate_events_cache()
+
+    log.info("Event %d updated by %s", event_id, current_user.email)
+
+    return event_out_from_model(db_event)
 
 @app.delete("/events/{event_id}", status_code=status.HTTP_204_NO_CONTENT, tags=["events"])
-def delete_event(
+async def delete_event(
     event_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """Delete an event (requires ownership)"""
-    event = session.get(EventModel, event_id)
+    event = await session.get(EventModel, event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
@@ -673,86 +955,59 @@ def delete_event(
             detail="Not authorized to delete this event"
         )
 
-    # Delete associated favorites first (cascade delete)
-    favorites = session.exec(
-        select(Favorite).where(Favorite.event_id == event_id)
-    ).all()
-    for fav in favorites:
-        session.delete(fav)
-
-    session.delete(event)
-    session.commit()
+    # Favorites and tag links go with it via ON DELETE CASCADE
+    await session.delete(event)
+    await session.commit()
+    await invalidate_events_cache()
     # Return None for 204 No Content (no response body)
     return None
 
 # --- 11b. Favorites Endpoints ---
 @app.get("/favorites/", response_model=List[EventOut], tags=["favorites"])
-def list_favorites(
-    session: Session = Depends(get_session),
+async def list_favorites(
+    session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """List the current user's favorited events."""
     try:
         statement = (
             select(EventModel)
+            .options(raiseload(EventModel.owner), defer(EventModel.search_text))
             .join(Favorite, Favorite.event_id == EventModel.id)
             .where(Favorite.user_id == current_user.id)
+            .order_by(EventModel.starts_at.desc())
         )
-        events = session.exec(statement).all()
-        events.sort(key=lambda e: e.starts_at, reverse=True)
-        return [
-            EventOut(
-                id=ev.id,
-                name=ev.name,
-                starts_at=ev.starts_at,
-                ends_at=ev.ends_at,
-                location=ev.location,
-                description=ev.description,
-                host=ev.host,
-                tags=ev.tags,
-                created_at=ev.created_at,
-                owner_id=ev.owner_id
-            )
-            for ev in events
-        ]
+        events = (await session.exec(statement)).all()
+        return EVENT_LIST_ADAPTER.validate_python(events, from_attributes=True)
     except Exception as e:
-        print(f"❌ Error fetching favorites: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Error fetching favorites")
         # If table doesn't exist, return empty list instead of crashing
         if "does not exist" in str(e).lower() or "no such table" in str(e).lower():
-            print("⚠️ Favorite table doesn't exist yet. Returning empty list.")
+            log.warning("Favorite table doesn't exist yet. Returning empty list.")
             return []
         raise HTTPException(status_code=500, detail=f"Error fetching favorites: {str(e)}")
 
 @app.post("/events/{event_id}/favorite", status_code=status.HTTP_204_NO_CONTENT, tags=["favorites"])
-def favorite_event(
+async def favorite_event(
     event_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """Favorite an event for the current user (idempotent)."""
     try:
-        event = session.get(EventModel, event_id)
-        if not event:
+        # One round trip: an existing favorite is a no-op, a missing event trips the FK
+        statement = pg_insert(Favorite).values(user_id=current_user.id, event_id=event_id).on_conflict_do_nothing()
+        try:
+            await session.exec(statement)
+            await session.commit()
+        except IntegrityError:
+            await session.rollback()
             raise HTTPException(status_code=404, detail="Event not found")
-
-        existing = session.exec(
-            select(Favorite).where(
-                Favorite.user_id == current_user.id,
-                Favorite.event_id == event_id
-            )
-        ).first()
-        if existing:
-            return
-
-        session.add(Favorite(user_id=current_user.id, event_id=event_id))
-        session.commit()
         return
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"❌ Error favoriting event: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Error favoriting event")
         error_msg = str(e).lower()
         if "does not exist" in error_msg or "no such table" in error_msg or "relation" in error_msg:
             raise HTTPException(
@@ -762,27 +1017,23 @@ def favorite_event(
         raise HTTPException(status_code=500, detail=f"Error favoriting event: {str(e)}")
 
 @app.delete("/events/{event_id}/favorite", status_code=status.HTTP_204_NO_CONTENT, tags=["favorites"])
-def unfavorite_event(
+async def unfavorite_event(
     event_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """Unfavorite an event for the current user (idempotent)."""
     try:
-        fav = session.exec(
-            select(Favorite).where(
+        await session.exec(
+            delete(Favorite).where(
                 Favorite.user_id == current_user.id,
                 Favorite.event_id == event_id
             )
-        ).first()
-        if fav:
-            session.delete(fav)
-            session.commit()
+        )
+        await session.commit()
         return
     except Exception as e:
-        print(f"❌ Error unfavoriting event: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Error unfavoriting event")
         error_msg = str(e).lower()
         if "does not exist" in error_msg or "no such table" in error_msg or "relation" in error_msg:
             raise HTTPException(
@@ -793,7 +1044,7 @@ def unfavorite_event(
 
 # --- 12. Health Check ---
 @app.get("/", tags=["health"])
-def health_check():
+async def health_check():
     """Health check endpoint"""
     return {
         "status": "healthy", 
@@ -802,11 +1053,11 @@ def health_check():
     }
 
 @app.get("/health/favorites", tags=["health"])
-def health_check_favorites(session: Session = Depends(get_session)):
+async def health_check_favorites(session: AsyncSession = Depends(get_session)):
     """Check if favorites endpoints are available"""
     try:
         # Try to query the favorite table to see if it exists
-        result = session.exec(select(Favorite).limit(1)).first()
+        result = (await session.exec(select(Favorite).limit(1))).first()
         return {
             "status": "ok",
             "favorites_table_exists": True,
@@ -818,7 +1069,7 @@ def health_check_favorites(session: Session = Depends(get_session)):
             return {
                 "status": "error",
                 "favorites_table_exists": False,
-                "message": "Favorites table does not exist. Run create_db_and_tables() or create the table manually.",
+                "message": "Favorites table does not exist. Run `alembic upgrade head` from backend/.",
                 "error": str(e)
             }
         return {
@@ -830,7 +1081,7 @@ def health_check_favorites(session: Session = Depends(get_session)):
 @app.post("/admin/cleanup-stale-favorites", tags=["admin"])
 async def cleanup_stale_favorites(
     admin: User = Depends(get_current_admin),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
     """
     Clean up favorites that point to deleted events (admin only).
@@ -839,21 +1090,19 @@ async def cleanup_stale_favorites(
     (Requires admin authentication)
     """
     try:
-        with engine.connect() as conn:
-            # Delete favorites where the event_id doesn't exist in eventmodel
-            # Using LEFT JOIN approach which is more reliable
-            result = conn.execute(text("""
-                DELETE FROM favorite
-                WHERE event_id NOT IN (SELECT id FROM eventmodel)
-            """))
-            deleted_count = result.rowcount
-            conn.commit()
-            
-            return {
-                "status": "success",
-                "message": f"Cleaned up {deleted_count} stale favorites",
-                "deleted_count": deleted_count
-            }
+        # Delete favorites where the event_id doesn't exist in eventmodel
+        result = await session.exec(
+            # NOT EXISTS plans as an anti-join on the eventmodel PK; NOT IN can't, due to NULL semantics
+            delete(Favorite).where(~exists().where(EventModel.id == Favorite.event_id))
+        )
+        deleted_count = result.rowcount
+        await session.commit()
+        
+        return {
+            "status": "success",
+            "message": f"Cleaned up {deleted_count} stale favorites",
+            "deleted_count": deleted_count
+        }
     except Exception as e:
         error_msg = str(e).lower()
         # Check if it's a "table doesn't exist" error
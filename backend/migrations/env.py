@@ -0,0 +1,64 @@
+import asyncio
+from logging.config import fileConfig
+
+from alembic import context
+from sqlmodel import SQLModel
+
+import main  # registers the table models and builds the engine from DATABASE_URL
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = SQLModel.metadata
+
+# Created with raw SQL in migrations (expression/partial/trigram indexes and the
+# unmapped google_id column), so they aren't on the models; without this,
+# autogenerate would propose dropping them
+SQL_ONLY_INDEXES = {
+    "ix_eventmodel_search",
+    "ix_eventmodel_search_text_trgm",
+    "ix_eventmodel_upcoming_no_end",
+    "ix_eventmodel_ends_at",
+    "ix_user_google_id",
+}
+SQL_ONLY_COLUMNS = {("user", "google_id")}
+
+
+def include_object(object, name, type_, reflected, compare_to) -> bool:
+    if type_ == "index" and name in SQL_ONLY_INDEXES:
+        return False
+    if type_ == "column" and (object.table.name, name) in SQL_ONLY_COLUMNS:
+        return False
+    return True
+
+
+def run_migrations_offline() -> None:
+    """Emit the migration SQL without connecting (alembic upgrade head --sql)"""
+    context.configure(
+        url=main.ASYNC_DATABASE_URL,
+        target_metadata=target_metadata,
+        include_object=include_object,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection) -> None:
+    context.configure(connection=connection, target_metadata=target_metadata, include_object=include_object)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_migrations_online() -> None:
+    async with main.engine.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+    await main.engine.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    asyncio.run(run_migrations_online())
@@ -0,0 +1,195 @@
+"""Baseline: the schema main.py used to build with create_all() + SCHEMA_UPGRADES at startup
+
+Every statement is idempotent, so this applies cleanly both to an empty database
+and to one that was already set up (and partially upgraded) by the old startup hook.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15
+"""
+import logging
+import unicodedata
+
+from alembic import context, op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+TABLES = [
+    """
+    CREATE TABLE IF NOT EXISTS "user" (
+        id SERIAL PRIMARY KEY,
+        email VARCHAR NOT NULL,
+        name VARCHAR NOT NULL,
+        hashed_password VARCHAR,
+        is_host BOOLEAN NOT NULL,
+        created_at TIMESTAMP WITH TIME ZONE NOT NULL
+    )
+    """,
+    'CREATE UNIQUE INDEX IF NOT EXISTS ix_user_email ON "user" (email)',
+    """
+    CREATE TABLE IF NOT EXISTS tag (
+        id SERIAL PRIMARY KEY,
+        name VARCHAR NOT NULL
+    )
+    """,
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_tag_name ON tag (name)",
+    """
+    CREATE TABLE IF NOT EXISTS eventmodel (
+        id SERIAL PRIMARY KEY,
+        name VARCHAR NOT NULL,
+        starts_at TIMESTAMP WITH TIME ZONE NOT NULL,
+        location VARCHAR NOT NULL,
+        ends_at TIMESTAMP WITH TIME ZONE,
+        description VARCHAR,
+        host VARCHAR,
+        tags VARCHAR,
+        search_text VARCHAR,
+        created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+        owner_id INTEGER REFERENCES "user" (id) ON DELETE SET NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS eventtag (
+        event_id INTEGER NOT NULL REFERENCES eventmodel (id) ON DELETE CASCADE,
+        tag_id INTEGER NOT NULL REFERENCES tag (id),
+        PRIMARY KEY (event_id, tag_id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_eventtag_tag_id ON eventtag (tag_id)",
+    """
+    CREATE TABLE IF NOT EXISTS favorite (
+        user_id INTEGER NOT NULL REFERENCES "user" (id) ON DELETE CASCADE,
+        event_id INTEGER NOT NULL REFERENCES eventmodel (id) ON DELETE CASCADE,
+        created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+        PRIMARY KEY (user_id, event_id)
+    )
+    """,
+]
+
+# Upgrades for databases created by older versions of the startup hook
+UPGRADES = [
+    # Google OAuth users have no password; google_id is kept for accounts linked by it
+    'ALTER TABLE "user" ALTER COLUMN hashed_password DROP NOT NULL',
+    'ALTER TABLE "user" ADD COLUMN IF NOT EXISTS google_id VARCHAR(255)',
+    'CREATE INDEX IF NOT EXISTS ix_user_google_id ON "user" (google_id)',
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "ALTER TABLE eventmodel ADD COLUMN IF NOT EXISTS search_text VARCHAR",
+    # Timestamps used to be naive TIMESTAMP holding UTC; convert any that still are
+    """
+    DO $$
+    DECLARE col record;
+    BEGIN
+        FOR col IN
+            SELECT table_name, column_name FROM information_schema.columns
+            WHERE table_schema = current_schema()
+              AND data_type = 'timestamp without time zone'
+              AND (table_name, column_name) IN (
+                  ('user', 'created_at'), ('eventmodel', 'starts_at'), ('eventmodel', 'ends_at'),
+                  ('eventmodel', 'created_at'), ('favorite', 'created_at'))
+        LOOP
+            EXECUTE format('ALTER TABLE %I ALTER COLUMN %I TYPE TIMESTAMPTZ USING %I AT TIME ZONE ''UTC''',
+                           col.table_name, col.column_name, col.column_name);
+        END LOOP;
+    END $$
+    """,
+    # One trigram index on the normalized search_text replaces the per-column ones
+    "DROP INDEX IF EXISTS ix_eventmodel_name_trgm",
+    "DROP INDEX IF EXISTS ix_eventmodel_location_trgm",
+    "DROP INDEX IF EXISTS ix_eventmodel_description_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_eventmodel_search_text_trgm ON eventmodel USING gin (search_text gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_eventmodel_search ON eventmodel USING gin ("
+    "to_tsvector('english', eventmodel.name || ' ' || eventmodel.location"
+    " || ' ' || coalesce(eventmodel.description, '')))",
+    # list_events orders by starts_at with a LIMIT, so an index scan can stop early;
+    # (owner_id, starts_at) serves per-owner lookups in start order
+    "CREATE INDEX IF NOT EXISTS ix_eventmodel_starts_at ON eventmodel (starts_at)",
+    "CREATE INDEX IF NOT EXISTS ix_eventmodel_owner_id_starts_at ON eventmodel (owner_id, starts_at)",
+    "CREATE INDEX IF NOT EXISTS ix_favorite_event_id ON favorite (event_id)",
+    # Partial indexes for the two branches of the default "not ended yet" filter
+    "CREATE INDEX IF NOT EXISTS ix_eventmodel_upcoming_no_end ON eventmodel (starts_at) WHERE ends_at IS NULL",
+    "CREATE INDEX IF NOT EXISTS ix_eventmodel_ends_at ON eventmodel (ends_at) WHERE ends_at IS NOT NULL",
+    # Backfill tag/eventtag for events created before tags were normalized
+    """
+    INSERT INTO tag (name)
+    SELECT DISTINCT lower(trim(t)) FROM eventmodel, unnest(string_to_array(eventmodel.tags, ',')) AS t
+    WHERE trim(t) <> ''
+    ON CONFLICT (name) DO NOTHING
+    """,
+    """
+    INSERT INTO eventtag (event_id, tag_id)
+    SELECT DISTINCT e.id, tag.id
+    FROM eventmodel e, unnest(string_to_array(e.tags, ',')) AS t
+    JOIN tag ON tag.name = lower(trim(t))
+    WHERE NOT EXISTS (SELECT 1 FROM eventtag et WHERE et.event_id = e.id)
+    ON CONFLICT DO NOTHING
+    """,
+    # Let Postgres handle dependents of deleted rows instead of per-row ORM deletes
+    """
+    DO $$
+    BEGIN
+        IF EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'favorite_event_id_fkey' AND confdeltype <> 'c') THEN
+            ALTER TABLE favorite
+                DROP CONSTRAINT favorite_event_id_fkey,
+                ADD CONSTRAINT favorite_event_id_fkey
+                    FOREIGN KEY (event_id) REFERENCES eventmodel (id) ON DELETE CASCADE;
+        END IF;
+        IF EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'favorite_user_id_fkey' AND confdeltype <> 'c') THEN
+            ALTER TABLE favorite
+                DROP CONSTRAINT favorite_user_id_fkey,
+                ADD CONSTRAINT favorite_user_id_fkey
+                    FOREIGN KEY (user_id) REFERENCES "user" (id) ON DELETE CASCADE;
+        END IF;
+        -- Events outlive their owner's account
+        IF EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'eventmodel_owner_id_fkey' AND confdeltype <> 'n') THEN
+            ALTER TABLE eventmodel
+                DROP CONSTRAINT eventmodel_owner_id_fkey,
+                ADD CONSTRAINT eventmodel_owner_id_fkey
+                    FOREIGN KEY (owner_id) REFERENCES "user" (id) ON DELETE SET NULL;
+        END IF;
+    END $$
+    """,
+]
+
+
+def build_search_text(row) -> str:
+    """Frozen copy of main.build_search_text as of this revision: fields joined
+    with \x1f, NFKC-normalized, casefolded"""
+    value = f"{row.name}\x1f{row.location}\x1f{row.description or ''}"
+    return unicodedata.normalize("NFKC", value).casefold()
+
+
+def backfill_search_text() -> None:
+    """Fill search_text for events written before the column existed"""
+    if context.is_offline_mode():
+        # The normalization runs in Python, so it can't be emitted as SQL
+        message = (
+            "search_text backfill skipped in --sql mode (it runs in Python); events whose"
+            " search_text is NULL won't match q substring search until it is filled"
+        )
+        op.get_context().impl.static_output(f"-- {message}")
+        logging.getLogger("alembic").warning(message)
+        return
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text("SELECT id, name, location, description FROM eventmodel WHERE search_text IS NULL")
+    ).all()
+    if rows:
+        bind.execute(
+            sa.text("UPDATE eventmodel SET search_text = :search_text WHERE id = :id"),
+            [{"id": row.id, "search_text": build_search_text(row)} for row in rows],
+        )
+
+
+def upgrade() -> None:
+    for statement in TABLES + UPGRADES:
+        op.execute(statement)
+    backfill_search_text()
+
+
+def downgrade() -> None:
+    # Nothing before the baseline to go back to
+    pass
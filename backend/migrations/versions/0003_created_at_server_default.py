@@ -0,0 +1,26 @@
+"""Let Postgres fill in created_at
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+TABLES = ["user", "eventmodel", "favorite"]
+
+
+def upgrade() -> None:
+    # Only a catalog change; existing rows are not rewritten
+    for table in TABLES:
+        op.alter_column(table, "created_at", server_default=sa.text("now()"))
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, "created_at", server_default=None)
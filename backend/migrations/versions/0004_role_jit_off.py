@@ -0,0 +1,24 @@
+"""Turn JIT off for the app's database role
+
+Connections through PgBouncer can't pass jit=off as a startup parameter, so
+make it the role's default; direct connections also send it (DB_SERVER_SETTINGS).
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # A role may set its own defaults; takes effect for new server connections
+    op.execute("ALTER ROLE CURRENT_USER SET jit = off")
+
+
+def downgrade() -> None:
+    op.execute("ALTER ROLE CURRENT_USER RESET jit")
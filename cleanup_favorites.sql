@@ -13,12 +13,12 @@
 
 -- STEP 1: Check how many stale favorites exist (optional - just to see what will be deleted)
 SELECT COUNT(*) as stale_favorites_count 
-FROM favorite 
-WHERE event_id NOT IN (SELECT id FROM eventmodel);
+FROM favorite f
+WHERE NOT EXISTS (SELECT 1 FROM eventmodel e WHERE e.id = f.event_id);
 
 -- STEP 2: Delete the stale favorites
-DELETE FROM favorite 
-WHERE event_id NOT IN (SELECT id FROM eventmodel);
+DELETE FROM favorite f
+WHERE NOT EXISTS (SELECT 1 FROM eventmodel e WHERE e.id = f.event_id);
 
 -- After running, you should see a message like "DELETE 5" (5 being the number deleted)
 -- The stale favorites are now removed from the database!